@@ -0,0 +1,33 @@
+"""
+Optional numba acceleration for small numerical kernels.
+
+numba adds ~150 ms to import time, so it is only imported (and the
+kernel compiled) the first time a wrapped kernel is called. Without
+numba installed, kernels run as plain Python/NumPy.
+"""
+
+import functools
+import importlib.util
+from typing import Callable
+
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+def lazy_njit(func: Callable) -> Callable:
+    """Compile ``func`` with ``numba.njit(cache=True)`` on first call."""
+    if not HAVE_NUMBA:
+        return func
+    compiled = None
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+                compiled = njit(cache=True)(func)
+            except ImportError:  # Broken install: run uncompiled
+                compiled = func
+        return compiled(*args)
+
+    return wrapper
@@ -10,9 +10,12 @@ Methods on the Pareto frontier represent the optimal tradeoffs available.
 """
 
 import numpy as np
-from typing import List, Tuple
+from numpy.typing import ArrayLike
+from typing import List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from ._jit import HAVE_NUMBA, lazy_njit
+
 
 @dataclass(frozen=True)
 class ParetoPoint:
@@ -26,38 +29,155 @@ class ParetoPoint:
 class ParetoFrontier:
     """Compute and analyze Pareto frontiers for alignment tradeoffs."""
 
+    # Below this size the compiled pairwise loop beats allocating the
+    # dominance matrix (only used when numba is installed).
+    JIT_THRESHOLD = 32
+    # Above this size the O(n^2) dominance matrix stops fitting in cache
+    # and the O(n log n) sweep wins.
+    SWEEP_THRESHOLD = 64
+
     @staticmethod
-    def compute(methods: List[str], overheads: np.ndarray,
-                safeties: np.ndarray) -> List[ParetoPoint]:
+    def compute(methods: List[str], overheads: ArrayLike,
+                safeties: ArrayLike) -> List[ParetoPoint]:
         """Find the Pareto-optimal methods.
 
         Parameters
         ----------
         methods : method names
-        overheads : overhead values (lower better)
-        safeties : safety scores (higher better)
+        overheads : overhead values (lower better), any array-like
+        safeties : safety scores (higher better), any array-like
 
         Returns list of ParetoPoint, with dominated flag.
         """
         n = len(methods)
-        dominated = [False] * n
-
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    continue
-                # j dominates i if j has lower overhead AND higher safety
-                if overheads[j] <= overheads[i] and safeties[j] >= safeties[i]:
-                    if overheads[j] < overheads[i] or safeties[j] > safeties[i]:
-                        dominated[i] = True
-                        break
-
-        return [ParetoPoint(methods[i], float(overheads[i]),
-                            float(safeties[i]), dominated[i])
-                for i in range(n)]
+        if n > ParetoFrontier.SWEEP_THRESHOLD:
+            return ParetoFrontier.compute_sweep(methods, overheads, safeties)
+
+        overheads, safeties = _as_columns(methods, overheads, safeties)
+
+        if HAVE_NUMBA and n < ParetoFrontier.JIT_THRESHOLD:
+            dominated = _dominated_kernel(overheads, safeties)
+        else:
+            dominated = _dominated_broadcast(overheads, safeties)
+
+        return _to_points(methods, overheads, safeties, dominated)
+
+    @staticmethod
+    def compute_sweep(methods: List[str], overheads: ArrayLike,
+                      safeties: ArrayLike) -> List[ParetoPoint]:
+        """Find the Pareto-optimal methods with an O(n log n) skyline sweep.
+
+        Same result as ``compute``, but uses O(n) memory. Points are
+        visited by overhead ascending, safety descending; a point is
+        dominated iff an earlier point has safety at least as high.
+        Exact duplicates share the verdict of their first occurrence,
+        since identical points do not dominate each other. Points with a
+        NaN coordinate are incomparable and never dominated.
+        """
+        overheads, safeties = _as_columns(methods, overheads, safeties)
+
+        # NaN compares false both ways, so such points neither dominate nor
+        # are dominated (as in the pairwise paths); sweep only the rest.
+        valid = np.flatnonzero(~(np.isnan(overheads) | np.isnan(safeties)))
+        n = len(valid)
+
+        order = valid[np.lexsort((-safeties[valid], overheads[valid]))]
+        o_sorted = overheads[order]
+        s_sorted = safeties[order]
+        # Best safety among all points strictly before each sorted position
+        prev_max = np.fmax.accumulate(np.concatenate(([-np.inf], s_sorted[:-1])))
+        dom_sorted = s_sorted <= prev_max
+        dom_sorted[:1] = False  # Nothing precedes the first point, even at -inf
+
+        # Each point in a run of exact duplicates takes the first one's verdict
+        run_start = np.ones(n, dtype=bool)
+        run_start[1:] = (o_sorted[1:] != o_sorted[:-1]) | (s_sorted[1:] != s_sorted[:-1])
+        first = np.maximum.accumulate(np.where(run_start, np.arange(n), 0))
+
+        dominated = np.zeros(len(methods), dtype=bool)
+        dominated[order] = dom_sorted[first]
+
+        return _to_points(methods, overheads, safeties, dominated)
 
     @staticmethod
     def frontier_only(points: List[ParetoPoint]) -> List[ParetoPoint]:
         """Return only non-dominated points, sorted by overhead."""
         return sorted([p for p in points if not p.dominated],
                       key=lambda p: p.overhead)
+
+    @staticmethod
+    def frontier_overheads(frontier: List[ParetoPoint]) -> np.ndarray:
+        """Sorted overhead array for ``query``; build once per frontier."""
+        return np.fromiter((p.overhead for p in frontier),
+                           dtype=np.float64, count=len(frontier))
+
+    @staticmethod
+    def query(frontier: List[ParetoPoint], budget: ArrayLike,
+              overheads_sorted: Optional[np.ndarray] = None
+              ) -> Union[Optional[ParetoPoint], List[Optional[ParetoPoint]]]:
+        """Safest frontier point with overhead within budget.
+
+        ``frontier`` must be sorted by overhead, as returned by
+        ``frontier_only``. Safety rises along it, so the most expensive
+        affordable point is the safest. Returns None if nothing fits; a
+        1-D array of budgets gives a list. Pass ``overheads_sorted`` from
+        ``frontier_overheads`` to make repeated lookups O(log n).
+        """
+        if np.ndim(budget) > 1:
+            raise ValueError("budget must be a scalar or a 1-D array")
+        if overheads_sorted is None:
+            overheads_sorted = ParetoFrontier.frontier_overheads(frontier)
+        idx = np.searchsorted(overheads_sorted, budget, side="right") - 1
+        if np.ndim(idx) == 0:
+            return frontier[idx] if idx >= 0 else None
+        return [frontier[i] if i >= 0 else None for i in idx.tolist()]
+
+
+def _as_columns(methods: List[str], overheads: ArrayLike,
+                safeties: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    overheads = np.asarray(overheads, dtype=np.float64)
+    safeties = np.asarray(safeties, dtype=np.float64)
+    if not len(methods) == len(overheads) == len(safeties):
+        raise ValueError(
+            f"Length mismatch: {len(methods)} methods, "
+            f"{len(overheads)} overheads, {len(safeties)} safeties")
+    return overheads, safeties
+
+
+def _to_points(methods: List[str], overheads: np.ndarray,
+               safeties: np.ndarray, dominated: np.ndarray) -> List[ParetoPoint]:
+    return [ParetoPoint(m, o, s, d)
+            for m, o, s, d in zip(methods, overheads.tolist(),
+                                  safeties.tolist(), dominated.tolist())]
+
+
+def _dominated_broadcast(overheads: np.ndarray, safeties: np.ndarray) -> np.ndarray:
+    """Pairwise dominance check as one n x n broadcast comparison."""
+    # j dominates i if j has lower-or-equal overhead AND higher-or-equal
+    # safety, strictly better on at least one. Row i, column j.
+    n = overheads.shape[0]
+    o_i, o_j = overheads[:, None], overheads[None, :]
+    s_i, s_j = safeties[:, None], safeties[None, :]
+    lt_o = o_j <= o_i
+    gt_s = s_j >= s_i
+    strict = (o_j < o_i) | (s_j > s_i)
+    return np.any(lt_o & gt_s & strict & ~np.eye(n, dtype=bool), axis=1)
+
+
+def _dominated_loop(overheads: np.ndarray, safeties: np.ndarray) -> np.ndarray:
+    """Pairwise dominance check, written to be compiled by numba."""
+    n = overheads.shape[0]
+    dominated = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            # j dominates i if j has lower overhead AND higher safety
+            if overheads[j] <= overheads[i] and safeties[j] >= safeties[i]:
+                if overheads[j] < overheads[i] or safeties[j] > safeties[i]:
+                    dominated[i] = True
+                    break
+    return dominated
+
+
+_dominated_kernel = lazy_njit(_dominated_loop)
@@ -16,9 +16,11 @@ Kaplan et al. (2020). "Scaling Laws for Neural Language Models."
 """
 
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 from dataclasses import dataclass
 
+from ._jit import lazy_njit
+
 
 @dataclass(frozen=True)
 class ScalingFit:
@@ -45,27 +47,53 @@ class ScalingLawModel:
         param_counts : array of model sizes
         overheads : array of overhead percentages
         """
+        param_counts = np.asarray(param_counts, dtype=np.float64)
+        overheads = np.asarray(overheads, dtype=np.float64)
         log_n = np.log(param_counts)
-        log_o = np.log(np.maximum(overheads, 1e-10))
+        log_o = np.maximum(overheads, 1e-10)
+        np.log(log_o, out=log_o)  # Reuse the clamped buffer
 
         # Linear fit in log space: log(overhead) = log(a) + b*log(N)
-        coeffs = np.polyfit(log_n, log_o, 1)
-        b = coeffs[0]
-        a = np.exp(coeffs[1])
+        b, log_a = _linfit(log_n, log_o)
+        a = np.exp(log_a)
         c = 0.0
 
-        # R-squared
-        predicted = a * param_counts ** b + c
-        ss_res = np.sum((overheads - predicted) ** 2)
-        ss_tot = np.sum((overheads - overheads.mean()) ** 2)
+        # R-squared; the prediction is built in one buffer and turned into
+        # the residual in place, so no extra temporaries are allocated.
+        resid = np.power(param_counts, b, dtype=np.float64)
+        resid *= a
+        resid += c
+        resid -= overheads
+        ss_res = np.dot(resid, resid)
+        ss_tot = overheads.var() * overheads.size
         r2 = 1 - ss_res / ss_tot if ss_tot > 0 else 0.0
 
         self._fit = ScalingFit(a=float(a), b=float(b), c=float(c),
                                 r_squared=float(r2), method=method)
         return self._fit
 
-    def predict(self, param_count: float) -> float:
-        """Extrapolate overhead to new scale."""
+    def predict(self, param_count: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Extrapolate overhead to new scale(s).
+
+        Scalars return a float; arrays return an array of the same shape.
+        """
         if self._fit is None:
             raise RuntimeError("Call fit() first")
-        return self._fit.a * param_count ** self._fit.b + self._fit.c
+        n = np.asarray(param_count, dtype=np.float64)
+        out = self._fit.a * np.power(n, self._fit.b) + self._fit.c
+        return out.item() if out.ndim == 0 else out
+
+
+def _linfit_py(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """Closed-form degree-1 least squares: returns (slope, intercept)."""
+    xm = x.mean()
+    ym = y.mean()
+    dx = x - xm
+    den = (dx * dx).sum()
+    if den == 0.0:
+        raise ValueError("need at least two distinct param_counts")
+    slope = (dx * (y - ym)).sum() / den
+    return slope, ym - slope * xm
+
+
+_linfit = lazy_njit(_linfit_py)
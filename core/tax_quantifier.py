@@ -22,8 +22,10 @@ Overhead models:
 
 import json
 import numpy as np
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, field, asdict
+from numpy.typing import ArrayLike
+from typing import Dict, Iterator, List, Optional, Union
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -46,6 +48,116 @@ class BenchmarkResult:
         return asdict(self)
 
 
+_COLUMNS = tuple(f.name for f in fields(BenchmarkResult))
+
+_RESULT_DTYPE = np.dtype([
+    ("method", "U32"),
+    ("model_params", "i8"),
+    ("model_label", "U16"),
+    ("baseline_flops", "f8"),
+    ("aligned_flops", "f8"),
+    ("flops_overhead_pct", "f8"),
+    ("memory_baseline_mb", "f8"),
+    ("memory_aligned_mb", "f8"),
+    ("memory_overhead_pct", "f8"),
+    ("task_score_baseline", "f8"),
+    ("task_score_aligned", "f8"),
+    ("task_regression_pp", "f8"),
+])
+
+
+@dataclass(eq=False)
+class BenchmarkTable:
+    """Benchmark results stored column-wise, one array per field.
+
+    Iterating (or indexing) yields BenchmarkResult rows built on demand,
+    so the table can stand in for a list of results. Slices and integer
+    sequences return a sub-table. Equality is identity, as comparing
+    array columns has no single truth value.
+    """
+    method: np.ndarray
+    model_params: np.ndarray
+    model_label: np.ndarray
+    baseline_flops: np.ndarray
+    aligned_flops: np.ndarray
+    flops_overhead_pct: np.ndarray
+    memory_baseline_mb: np.ndarray
+    memory_aligned_mb: np.ndarray
+    memory_overhead_pct: np.ndarray
+    task_score_baseline: np.ndarray
+    task_score_aligned: np.ndarray
+    task_regression_pp: np.ndarray
+    _by_method: Dict[str, List[int]] = field(default_factory=dict, init=False,
+                                             repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._index_methods(self.method.tolist(), start=0)
+
+    def _index_methods(self, methods: List[str], start: int) -> None:
+        for i, m in enumerate(methods, start):
+            self._by_method.setdefault(m, []).append(i)
+
+    @classmethod
+    def empty(cls) -> "BenchmarkTable":
+        cols = {name: np.empty(0, dtype=np.float64) for name in _COLUMNS}
+        cols["method"] = np.empty(0, dtype=str)
+        cols["model_label"] = np.empty(0, dtype=str)
+        cols["model_params"] = np.empty(0, dtype=np.int64)
+        # Caller-supplied value, kept as given (an int baseline stays an int)
+        cols["task_score_baseline"] = np.empty(0, dtype=object)
+        return cls(**cols)
+
+    def __len__(self) -> int:
+        return len(self.method)
+
+    def __iter__(self) -> Iterator[BenchmarkResult]:
+        columns = [getattr(self, name).tolist() for name in _COLUMNS]
+        return (BenchmarkResult(*values) for values in zip(*columns))
+
+    def __getitem__(self, i: Union[int, slice, ArrayLike]
+                    ) -> Union[BenchmarkResult, "BenchmarkTable"]:
+        if isinstance(i, slice):
+            return self.take(range(*i.indices(len(self))))
+        if isinstance(i, (int, np.integer)):
+            return self.row(i)
+        rows = np.asarray(i)
+        if rows.ndim == 1 and (rows.size == 0 or rows.dtype.kind in "iu"):
+            return self.take(rows)
+        raise TypeError(f"BenchmarkTable indices must be integers, slices or "
+                        f"1-D integer sequences, not {type(i).__name__}")
+
+    def row(self, i: int) -> BenchmarkResult:
+        return next(iter(self.take([i])))
+
+    def extend(self, other: "BenchmarkTable") -> None:
+        """Append another table's rows in place."""
+        self._index_methods(other.method.tolist(), start=len(self))
+        for name in _COLUMNS:
+            setattr(self, name, np.concatenate([getattr(self, name),
+                                                getattr(other, name)]))
+
+    def take(self, rows) -> "BenchmarkTable":
+        """New table holding the given row indices, in that order."""
+        rows = np.asarray(rows, dtype=np.intp)
+        return BenchmarkTable(**{name: getattr(self, name)[rows] for name in _COLUMNS})
+
+    def by_method(self, method: str) -> "BenchmarkTable":
+        """Rows for one method, looked up in the per-method index."""
+        return self.take(self._by_method.get(method, []))
+
+    def to_array(self) -> np.ndarray:
+        """Copy into one read-only structured array (dtype _RESULT_DTYPE)."""
+        arr = np.empty(len(self), dtype=_RESULT_DTYPE)
+        for name in _COLUMNS:
+            arr[name] = getattr(self, name)
+        arr.flags.writeable = False
+        return arr
+
+    def to_dicts(self) -> List[dict]:
+        columns = [getattr(self, name).tolist() for name in _COLUMNS]
+        return [dict(zip(_COLUMNS, values)) for values in zip(*columns)]
+
+
 @dataclass
 class MethodProfile:
     """Overhead profile for an alignment method."""
@@ -73,6 +185,32 @@ METHODS: Dict[str, MethodProfile] = {
     "rome": MethodProfile("rome", 1.00, 1.00, 0.003, "Meng et al. (2022)"),
 }
 
+# Parallel arrays over METHODS, indexed through _METHOD_INDEX, so benchmark()
+# can gather per-method multipliers with one fancy-index instead of a loop.
+_METHOD_INDEX: Dict[str, int] = {name: i for i, name in enumerate(METHODS)}
+_FLOPS_MULT = np.array([p.flops_multiplier for p in METHODS.values()])
+_MEMORY_MULT = np.array([p.memory_multiplier for p in METHODS.values()])
+_TASK_REGRESSION = np.array([p.task_regression for p in METHODS.values()])
+
+_REPORT_ROW = "  %5s: FLOPs +%5.1f%% | Mem +%5.1f%% | Task -%4.1fpp"
+
+
+def _is_scalar(x) -> bool:
+    # 0-d arrays are unhashable, so they take the uncached path too
+    return not isinstance(x, np.ndarray) and np.ndim(x) == 0
+
+
+def _estimate_flops(params, seq_len):
+    return 2.0 * params * seq_len
+
+
+def _estimate_memory_mb(params, bytes_per_param):
+    return (params * bytes_per_param) / (1024 ** 2)
+
+
+_estimate_flops_cached = lru_cache(maxsize=128)(_estimate_flops)
+_estimate_memory_mb_cached = lru_cache(maxsize=128)(_estimate_memory_mb)
+
 
 class AlignmentTaxQuantifier:
     """Benchmark alignment overhead across methods and model scales."""
@@ -90,7 +228,7 @@ class AlignmentTaxQuantifier:
                  scales: Optional[List[str]] = None) -> None:
         self.method_names = methods or list(METHODS.keys())
         self.scale_names = scales or ["125M", "350M", "1.3B", "6.7B"]
-        self.results: List[BenchmarkResult] = []
+        self.results = BenchmarkTable.empty()
 
         for m in self.method_names:
             if m not in METHODS:
@@ -101,65 +239,100 @@ class AlignmentTaxQuantifier:
 
     @staticmethod
     def estimate_flops(params: int, seq_len: int = 2048) -> float:
-        """Forward pass FLOPs ≈ 2 * params * seq_len."""
-        return 2.0 * params * seq_len
+        """Forward pass FLOPs ≈ 2 * params * seq_len.
+
+        Scalar calls are memoized; arrays broadcast uncached.
+        """
+        if _is_scalar(params) and _is_scalar(seq_len):
+            return _estimate_flops_cached(params, seq_len)
+        return _estimate_flops(params, seq_len)
 
     @staticmethod
     def estimate_memory_mb(params: int, bytes_per_param: int = 2) -> float:
-        """Model memory in MB (parameters only, fp16/bf16)."""
-        return (params * bytes_per_param) / (1024 ** 2)
+        """Model memory in MB (parameters only, fp16/bf16).
+
+        Scalar calls are memoized; arrays broadcast uncached.
+        """
+        if _is_scalar(params) and _is_scalar(bytes_per_param):
+            return _estimate_memory_mb_cached(params, bytes_per_param)
+        return _estimate_memory_mb(params, bytes_per_param)
 
     def benchmark(self, task_baseline: float = 0.85, seq_len: int = 2048) -> List[BenchmarkResult]:
         """Run all benchmarks."""
-        results = []
-        for m_name in self.method_names:
-            method = METHODS[m_name]
-            for s_name in self.scale_names:
-                params = self.SCALES[s_name]
-                base_f = self.estimate_flops(params, seq_len)
-                base_m = self.estimate_memory_mb(params)
-                o = method.overhead(base_f, base_m, task_baseline)
-
-                result = BenchmarkResult(
-                    method=m_name, model_params=params, model_label=s_name,
-                    baseline_flops=base_f, aligned_flops=o["flops"],
-                    flops_overhead_pct=(method.flops_multiplier - 1) * 100,
-                    memory_baseline_mb=base_m, memory_aligned_mb=o["memory"],
-                    memory_overhead_pct=(method.memory_multiplier - 1) * 100,
-                    task_score_baseline=task_baseline,
-                    task_score_aligned=o["task"],
-                    task_regression_pp=method.task_regression * 100,
-                )
-                results.append(result)
-
-        self.results.extend(results)
-        return results
+        table = self._run(task_baseline, seq_len)
+        self.results.extend(table)
+        return list(table)
+
+    def benchmark_array(self, task_baseline: float = 0.85,
+                        seq_len: int = 2048) -> np.ndarray:
+        """Run all benchmarks, returning a read-only structured array."""
+        table = self._run(task_baseline, seq_len)
+        self.results.extend(table)
+        return table.to_array()
+
+    def _run(self, task_baseline: float, seq_len: int) -> BenchmarkTable:
+        idx = np.array([_METHOD_INDEX[m] for m in self.method_names], dtype=np.intp)
+        flops_mult = _FLOPS_MULT[idx]
+        memory_mult = _MEMORY_MULT[idx]
+        regression = _TASK_REGRESSION[idx]
+        params = np.array([self.SCALES[s] for s in self.scale_names], dtype=np.int64)
+        n_scales = len(params)
+
+        base_f = self.estimate_flops(params, seq_len)
+        base_m = self.estimate_memory_mb(params)
+
+        # Method x scale grid, flattened method-major (one row per method)
+        n_methods = len(idx)
+        return BenchmarkTable(
+            method=np.repeat(np.array(self.method_names), n_scales),
+            model_params=np.tile(params, n_methods),
+            model_label=np.tile(np.array(self.scale_names), n_methods),
+            baseline_flops=np.tile(base_f, n_methods),
+            aligned_flops=(flops_mult[:, None] * base_f[None, :]).ravel(),
+            flops_overhead_pct=np.repeat((flops_mult - 1) * 100, n_scales),
+            memory_baseline_mb=np.tile(base_m, n_methods),
+            memory_aligned_mb=(memory_mult[:, None] * base_m[None, :]).ravel(),
+            memory_overhead_pct=np.repeat((memory_mult - 1) * 100, n_scales),
+            task_score_baseline=np.full(n_methods * n_scales, task_baseline,
+                                        dtype=object),
+            task_score_aligned=np.repeat(task_baseline - regression, n_scales),
+            task_regression_pp=np.repeat(regression * 100, n_scales),
+        )
 
     def report(self) -> str:
         """Human-readable comparison table."""
         if not self.results:
             return "No benchmarks run."
         lines = ["Alignment Tax Report", "=" * 70, ""]
-        by_method = {}
-        for r in self.results:
-            by_method.setdefault(r.method, []).append(r)
-
-        for method, runs in sorted(by_method.items()):
-            profile = METHODS[method]
-            lines.append(f"{method.upper()} [{profile.citation}]")
-            lines.append("-" * 50)
-            for r in sorted(runs, key=lambda x: x.model_params):
-                lines.append(
-                    f"  {r.model_label:>5s}: FLOPs +{r.flops_overhead_pct:5.1f}% | "
-                    f"Mem +{r.memory_overhead_pct:5.1f}% | "
-                    f"Task -{r.task_regression_pp:4.1f}pp"
-                )
-            lines.append("")
+        t = self.results
+        names, codes = np.unique(t.method, return_inverse=True)
+        order = np.lexsort((t.model_params, codes))  # Stable: ties keep insertion order
+        labels = t.model_label.tolist()
+        flops_pct = t.flops_overhead_pct.tolist()
+        memory_pct = t.memory_overhead_pct.tolist()
+        regression_pp = t.task_regression_pp.tolist()
+        prev = -1
+        for i in order.tolist():
+            code = codes[i]
+            if code != prev:
+                if prev >= 0:
+                    lines.append("")
+                method = str(names[code])
+                lines.append(f"{method.upper()} [{METHODS[method].citation}]")
+                lines.append("-" * 50)
+                prev = code
+            lines.append(_REPORT_ROW % (labels[i], flops_pct[i],
+                                        memory_pct[i], regression_pp[i]))
+        lines.append("")
         return "\n".join(lines)
 
-    def to_json(self, path: Optional[str] = None) -> str:
-        data = [r.to_dict() for r in self.results]
-        output = json.dumps(data, indent=2)
+    def to_json(self, path: Optional[str] = None, compact: bool = False) -> str:
+        """Serialize results; ``compact`` drops indentation and spaces."""
+        data = self.results.to_dicts()
+        if compact:
+            output = json.dumps(data, separators=(",", ":"))
+        else:
+            output = json.dumps(data, indent=2)
         if path:
             with open(path, "w") as f:
                 f.write(output)
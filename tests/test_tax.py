@@ -1,5 +1,5 @@
 """Tests for alignment tax quantifier."""
-import sys, os
+import sys, os, json
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import numpy as np
 from core.tax_quantifier import AlignmentTaxQuantifier, METHODS
@@ -14,16 +14,53 @@ def test_benchmark():
     for r in results:
         assert r.flops_overhead_pct >= 0
         assert r.aligned_flops >= r.baseline_flops
+    params = np.array([125_000_000, 1_300_000_000])
+    flops = AlignmentTaxQuantifier.estimate_flops(params)
+    assert flops.tolist() == [AlignmentTaxQuantifier.estimate_flops(int(p)) for p in params]
+    assert AlignmentTaxQuantifier.estimate_flops(np.array(125_000_000)) == flops[0]
+    assert AlignmentTaxQuantifier.estimate_memory_mb(np.array(125_000_000)) > 0
     print(f"  {len(results)} benchmarks valid ✓")
 
 
 def test_ordering():
     q = AlignmentTaxQuantifier(scales=["1.3B"])
-    results = q.benchmark()
-    rlhf = next(r for r in results if r.method == "rlhf")
-    filt = next(r for r in results if r.method == "filtering")
-    assert rlhf.flops_overhead_pct > filt.flops_overhead_pct
-    print(f"  RLHF ({rlhf.flops_overhead_pct:.0f}%) > filtering ({filt.flops_overhead_pct:.0f}%) ✓")
+    q.benchmark()
+    rlhf = q.results.by_method("rlhf").flops_overhead_pct[0]
+    filt = q.results.by_method("filtering").flops_overhead_pct[0]
+    assert rlhf > filt
+    print(f"  RLHF ({rlhf:.0f}%) > filtering ({filt:.0f}%) ✓")
+
+
+def test_results_table():
+    q = AlignmentTaxQuantifier(methods=["rlhf", "dpo"])
+    first = q.benchmark()
+    second = q.benchmark(task_baseline=0.5)
+    assert len(q.results) == len(first) + len(second)
+    assert list(q.results) == first + second
+    assert q.results.row(len(first)) == second[0]
+    assert list(q.results[:2]) == first[:2]
+    assert list(q.results[-1:]) == second[-1:]
+    assert list(q.results[[0, len(first)]]) == [first[0], second[0]]
+    assert list(q.results[np.array([1])]) == first[1:2]
+    assert q.results == q.results and q.results != AlignmentTaxQuantifier().results
+    assert [r.to_dict() for r in q.results] == q.results.to_dicts()
+    dpo = q.results.by_method("dpo")
+    assert list(dpo) == [r for r in first + second if r.method == "dpo"]
+    assert len(q.results.by_method("rome")) == 0
+    assert json.loads(q.to_json(compact=True)) == json.loads(q.to_json())
+    q.benchmark(task_baseline=1)
+    assert type(q.results[-1].task_score_baseline) is int  # Kept as given
+    print(f"  Results table holds {len(q.results)} rows ✓")
+
+
+def test_benchmark_array():
+    q = AlignmentTaxQuantifier(scales=["125M", "70B"])
+    arr = q.benchmark_array()
+    assert len(arr) == len(q.results) == len(METHODS) * 2
+    assert not arr.flags.writeable
+    assert arr["method"].tolist() == q.results.method.tolist()
+    np.testing.assert_array_equal(arr["aligned_flops"], q.results.aligned_flops)
+    print(f"  Structured array: {arr.dtype.itemsize} bytes/row ✓")
 
 
 def test_scaling_law():
@@ -33,9 +70,33 @@ def test_scaling_law():
     fit = slm.fit(params, overhead)
     pred_13b = slm.predict(13e9)
     assert 35 < pred_13b < 45
+    curve = slm.predict(np.array([13e9, 70e9]))
+    assert curve.shape == (2,) and curve[0] == pred_13b
     print(f"  Scaling law R²={fit.r_squared:.3f}, 13B pred={pred_13b:.1f}% ✓")
 
 
+def test_scaling_law_degenerate():
+    from core import scaling
+    x = np.log(np.array([1e9, 1e9, 1e9]))
+    y = np.log(np.array([40.0, 41.0, 42.0]))
+    # Compiled (when numba is installed) and plain kernels must agree
+    for kernel in (scaling._linfit, scaling._linfit_py):
+        try:
+            kernel(x, y)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{kernel.__name__} accepted a degenerate fit")
+    for params, overhead in (([1e9, 1e9, 1e9], [40, 41, 42]), ([1e9], [40])):
+        try:
+            ScalingLawModel().fit(params, overhead)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"fit accepted {params}")
+    print("  Degenerate scaling fits rejected ✓")
+
+
 def test_pareto():
     methods = ["rlhf", "dpo", "filtering", "steering"]
     overheads = np.array([40, 15, 5, 2])
@@ -44,13 +105,56 @@ def test_pareto():
     frontier = ParetoFrontier.frontier_only(points)
     names = [p.method for p in frontier]
     assert "steering" in names  # Low overhead, good safety
+    assert ParetoFrontier.query(frontier, 20).method == "dpo"
+    assert ParetoFrontier.query(frontier, 1) is None
+    assert [p.method for p in ParetoFrontier.query(frontier, [2, 100])] == ["steering", "rlhf"]
+    cached = ParetoFrontier.frontier_overheads(frontier)
+    assert ParetoFrontier.query(frontier, 20, cached).method == "dpo"
+    try:
+        ParetoFrontier.query(frontier, [[2, 100]])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("query accepted 2-D budgets")
+    for compute in (ParetoFrontier.compute, ParetoFrontier.compute_sweep):
+        try:
+            compute(methods, overheads[:3], safeties)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{compute.__name__} accepted mismatched lengths")
     print(f"  Pareto frontier: {names} ✓")
 
 
+def test_pareto_sweep_matches_compute():
+    from core import pareto
+    rng = np.random.default_rng(0)
+    # 64 is the largest size compute() keeps on the broadcast path; below
+    # JIT_THRESHOLD it uses the numba kernel when numba is installed.
+    for n in (ParetoFrontier.JIT_THRESHOLD - 1, ParetoFrontier.SWEEP_THRESHOLD):
+        methods = [f"m{i}" for i in range(n)]
+        overheads = rng.integers(0, 10, n).astype(float)  # Plenty of ties
+        safeties = rng.integers(0, 10, n).astype(float)
+        overheads[1] = safeties[2] = np.nan  # Incomparable points
+        safeties[3] = -np.inf
+        broadcast = pareto._dominated_broadcast(overheads, safeties)
+        assert (pareto._dominated_kernel(overheads, safeties) == broadcast).all()
+        pairwise = ParetoFrontier.compute(methods, overheads, safeties)
+        sweep = ParetoFrontier.compute_sweep(methods, overheads, safeties)
+        # Compare flags: points holding NaN never compare equal
+        assert [p.dominated for p in pairwise] == broadcast.tolist()
+        assert [p.dominated for p in sweep] == broadcast.tolist()
+    print(f"  Sweep frontier: {len(ParetoFrontier.frontier_only(sweep))}/{n} points ✓")
+
+
 if __name__ == "__main__":
     print("alignment-tax-quantifier tests\n")
     test_benchmark()
     test_ordering()
+    test_results_table()
+    test_benchmark_array()
     test_scaling_law()
+    test_scaling_law_degenerate()
     test_pareto()
+    test_pareto_sweep_matches_compute()
     print("\n✓ All tests passed.")